@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 import argparse
+import hashlib
+import os
 import shutil
 import json
+from functools import lru_cache
 from pathlib import Path
 
 # --------------------------------------------------------------
 # DETERMINE COMPILER BASED ON ISA
 # --------------------------------------------------------------
+@lru_cache(maxsize=None)
 def determine_compiler(isa: str) -> str:
     """
     Return the compiler path based on the ISA:
@@ -22,6 +26,7 @@ def determine_compiler(isa: str) -> str:
 # FUNCTION TO EXPAND ISA ARGUMENTS
 # (c) → c AND non-c
 # --------------------------------------------------------------
+@lru_cache(maxsize=None)
 def expand_isa(isa):
     """
     Expand RISC-V compressed ISA `(c)` correctly:
@@ -86,6 +91,17 @@ UARCH_CONFIGS_RAW = {
     #"cv32e40p_corev_pulp": ("rv32im(c)_zicsr_xpulp", "ilp32"),
 }
 
+# Expanded once at import: '(c)' variants resolved, the compiler picked
+# from the pre-replacement ISA (which still names xpulp), then the xpulp
+# shorthand expanded. generate() just iterates the finished tuples.
+UARCH_CONFIGS = {
+    uarch: [
+        (replace_xpulp_extensions(isa), abi, determine_compiler(isa))
+        for isa in expand_isa(isa_raw)
+    ]
+    for uarch, (isa_raw, abi) in UARCH_CONFIGS_RAW.items()
+}
+
 
 # --------------------------------------------------------------
 # FPU RULE: derived from microarchitecture name
@@ -93,10 +109,14 @@ UARCH_CONFIGS_RAW = {
 def microarch_has_fpu(uarch_name: str):
     return "fpu" in uarch_name.lower()
 
+# Static, so resolved once: validity checks then cost one set lookup.
+_FPU_UARCHS = frozenset(u for u in UARCH_CONFIGS_RAW if microarch_has_fpu(u))
+
 
 # --------------------------------------------------------------
 # dtype detection from tpg folder name
 # --------------------------------------------------------------
+@lru_cache(maxsize=None)
 def infer_dtype(folder_name):
     if "instrType-float" in folder_name:
         return "float"
@@ -110,41 +130,51 @@ def infer_dtype(folder_name):
 # --------------------------------------------------------------
 # Validity rules based on dtype and uarch FPU
 # --------------------------------------------------------------
-def is_valid_combination(dtype, uarch_has_fpu):
-    if dtype in ("fixedpt", "double") and microarch_has_fpu(uarch_has_fpu):
+def is_valid_combination(dtype, uarch):
+    if dtype in ("fixedpt", "double") and uarch in _FPU_UARCHS:
         return False
     return True
 
 
+# Flat six-string-field config: a formatted template yields the exact
+# json.dumps(..., indent=4) byte layout without encoder dispatch. Only safe
+# because every value is a plain string; generate() asserts that.
+_CONFIG_TPL = (
+    '{{\n'
+    '    "tpg": "{tpg}",\n'
+    '    "uarch": "{uarch}",\n'
+    '    "isa": "{isa}",\n'
+    '    "abi": "{abi}",\n'
+    '    "dtype": "{dtype}",\n'
+    '    "compiler": "{compiler}"\n'
+    '}}'
+)
+
+# hash of serialized payload -> first path written this run; identical
+# payloads become hardlinks instead of fresh copies
+_SEEN = {}
+
+
 # --------------------------------------------------------------
 # Main generator
 # --------------------------------------------------------------
-def generate(tpg_folder):
+def generate(tpg_folder, verbose=False):
     tpg_folder = Path(tpg_folder)
     outdir = tpg_folder / "inference" / "configs"
-    outdir.mkdir(exist_ok=True, parents=True)
-    outdir_results = tpg_folder / "inference" / "results"
-    outdir_results.mkdir(exist_ok=True, parents=True)
-    outdir_overlays = tpg_folder / "inference" / "overlays"
-    outdir_overlays.mkdir(exist_ok=True, parents=True)
-    outdir_overlays = tpg_folder / "inference" / "tpg_inference_expe"
-    outdir_overlays.mkdir(exist_ok=True, parents=True)
+    for sub in ("configs", "results", "overlays", "tpg_inference_expe"):
+        (tpg_folder / "inference" / sub).mkdir(parents=True, exist_ok=True)
 
     dtype = infer_dtype(tpg_folder.name)
+    count = 0
 
-    for uarch, (isa_raw, abi) in UARCH_CONFIGS_RAW.items():
+    for uarch, variants in UARCH_CONFIGS.items():
 
         if not is_valid_combination(dtype, uarch):
-            print(f"[SKIP] {tpg_folder.name} on {uarch} (dtype={dtype})")
+            if verbose:
+                print(f"[SKIP] {tpg_folder.name} on {uarch} (dtype={dtype})")
             continue
 
-        expanded_isas = expand_isa(isa_raw)
-
-        for isa in expanded_isas:
-
-            compiler = determine_compiler(isa) #uses xpulp 
-
-            isa = replace_xpulp_extensions(isa) # replaces xpulp
+        for isa, abi, compiler in variants:
 
             filename = f"{uarch}_{isa}_{abi}_{dtype}.json"
             filepath = outdir / filename
@@ -159,10 +189,30 @@ def generate(tpg_folder):
                 "compiler": compiler
             }
 
-            with open(filepath, "w") as f:
-                json.dump(config, f, indent=4)
+            assert all('"' not in v and '\\' not in v for v in config.values())
+            payload = _CONFIG_TPL.format(**config).encode()
+
+            h = hashlib.blake2b(payload).hexdigest()
+            canon = _SEEN.get(h)
+            if canon is not None and canon != filepath:
+                try:
+                    if filepath.exists():
+                        filepath.unlink()
+                    os.link(canon, filepath)
+                except OSError:
+                    filepath.write_bytes(payload)
+            else:
+                # skip the rewrite when the on-disk bytes already match
+                if not (filepath.exists() and filepath.read_bytes() == payload):
+                    filepath.write_bytes(payload)
+                _SEEN[h] = filepath
+
+            count += 1
+            if verbose:
+                print(f"[OK] Created {filename}")
 
-            print(f"[OK] Created {filename}")
+    # one summary write instead of one line-buffered print per file
+    print(f"[OK] Wrote {count} configs to {outdir}")
 
 # --------------------------------------------------------------
 # CLI
@@ -170,5 +220,6 @@ def generate(tpg_folder):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--tpg_folder", required=True)
+    parser.add_argument("--verbose", action="store_true")
     args = parser.parse_args()
-    generate(args.tpg_folder)
\ No newline at end of file
+    generate(args.tpg_folder, verbose=args.verbose)
\ No newline at end of file
@@ -5,6 +5,37 @@ import re
 import shutil
 import sys
 
+try:
+    import pyjson5  # C-backed JSONC parser; comments handled without a regex pass
+except ImportError:
+    pyjson5 = None
+
+# Strips // and /* */ comments from the JSONC parameter files.
+_COMMENT_RE = re.compile(r'//.*?\n|/\*.*?\*/', re.DOTALL | re.MULTILINE)
+
+def _load_jsonc(text):
+    # Parses the possibly-commented parameter files from armlearn-wrapper.
+    # Most files are plain JSON: try the stdlib C parser first and only pay
+    # for comment handling when it actually fails.
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    if pyjson5 is not None:
+        return pyjson5.loads(text)
+    return json.loads(_COMMENT_RE.sub('', text))
+
+def _link_or_copy(src, dst):
+    # Hardlink when src and dst share a filesystem: new directory entry, no
+    # bytes copied. Callers that rewrite dst must unlink it first so the
+    # source inode stays pristine (modify_json does).
+    try:
+        if os.path.exists(dst):
+            os.unlink(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 def copy_files(expe_folder, custom_params_path, use_local_params):
     # Copies required parameter and log files from the container (armlearn-wrapper) to the experiment folder.
     # These files are then modified to create a unique experiment configuration.
@@ -19,14 +50,14 @@ def copy_files(expe_folder, custom_params_path, use_local_params):
     for file_name in files_to_copy:
         src_file_path = os.path.join(container_src_folder, file_name)
         dest_file_path = os.path.join(params_folder, file_name)
-        shutil.copy2(src_file_path, dest_file_path)
+        _link_or_copy(src_file_path, dest_file_path)
     # Handle params.json (custom or default)
     params_dest_path = os.path.join(params_folder, 'params.json')
     if use_local_params and os.path.exists(custom_params_path):
-        shutil.copy2(custom_params_path, params_dest_path)
+        _link_or_copy(custom_params_path, params_dest_path)
     else:
         src_params_path = os.path.join(container_src_folder, 'params.json')
-        shutil.copy2(src_params_path, params_dest_path)
+        _link_or_copy(src_params_path, params_dest_path)
     # display copied files
     #print("Copied files to experiment folder:")
     #for file in os.listdir(params_folder):
@@ -40,12 +71,10 @@ def experiment_name(config):
 def modify_json(expe_folder, config, training_time, training_cores):
     # Updates JSON config files with experiment config.
     # The training_time and training_cores values are provided by Nextflow config (see trainings.config).
-    pattern = r'//.*?\n|/\*.*?\*/'
     train_params_path = os.path.join(expe_folder, 'params', 'trainParams.json')
     with open(train_params_path, 'r') as json_file:
         json_content = json_file.read()
-    json_uncommented = re.sub(pattern, '', json_content, flags=re.DOTALL | re.MULTILINE)
-    data = json.loads(json_uncommented)
+    data = _load_jsonc(json_content)
     data['timeMaxTraining'] = int(training_time)  # From Nextflow config
     for key, value in config.items():
         if key in data:
@@ -54,6 +83,8 @@ def modify_json(expe_folder, config, training_time, training_cores):
             print(f"Key '{key}' not found in JSON file.")
         else:
             data[key] = value
+    # break the hardlink to the template before rewriting
+    os.unlink(train_params_path)
     with open(train_params_path, 'w') as json_file:
         json.dump(data, json_file, indent=4)
     # Modify params.json to set nbThreads
@@ -64,29 +95,51 @@ def modify_json(expe_folder, config, training_time, training_cores):
         return
     with open(params_json_path, 'r') as json_file:
         params_content = json_file.read()
-        params_uncommented = re.sub(pattern, '', params_content, flags=re.DOTALL | re.MULTILINE)
-        params_data = json.loads(params_uncommented)
+        params_data = _load_jsonc(params_content)
         params_data['nbThreads'] = int(training_cores)  # From Nextflow config
+        os.unlink(params_json_path)
         with open(params_json_path, 'w') as json_file:
             json.dump(params_data, json_file, indent=4)
 
-def main():
-    # Main entry point: parses arguments, creates experiment folder, copies files from container,
-    # and modifies the configuration using config and Nextflow config values.
+def generate_one(config, training_time, training_cores, custom_params_path, use_local_params, verbose=False):
+    # Creates one experiment folder, copies files from container, and modifies
+    # the configuration using config and Nextflow config values.
+    expe_name = experiment_name(config)
+    expe_folder = expe_name
+    if verbose:
+        print(f"Generate_configs.py: Generating configuration for experiment: {expe_name}")
+    copy_files(expe_folder, custom_params_path, use_local_params)
+    modify_json(expe_folder, config, training_time, training_cores)
+
+def main(verbose=False):
+    # Main entry point for a single experiment (one subprocess per config).
     config = json.loads(sys.argv[1])
     training_time = sys.argv[2]
     nb_generations = sys.argv[3]
     training_cores = sys.argv[4]
     custom_params_path = sys.argv[5]
     use_local_params = sys.argv[6].lower() == 'true'
-    print("use_local_params:", use_local_params) 
-    print(f"Use local params.json: {use_local_params}")
-    print(f"Custom params.json path: {custom_params_path}")
-    expe_name = experiment_name(config)
-    expe_folder = expe_name
-    print(f"Generate_configs.py: Generating configuration for experiment: {expe_name}")
-    copy_files(expe_folder, custom_params_path, use_local_params)
-    modify_json(expe_folder, config, training_time, training_cores)
+    if verbose:
+        print("use_local_params:", use_local_params)
+        print(f"Use local params.json: {use_local_params}")
+        print(f"Custom params.json path: {custom_params_path}")
+    generate_one(config, training_time, training_cores, custom_params_path, use_local_params, verbose)
+
+def main_batch(configs_json_path, training_time, training_cores, custom_params_path, use_local_params, verbose=False):
+    # Batch entry point: one interpreter for a whole sweep. The file holds a
+    # JSON list of experiment config dicts.
+    with open(configs_json_path) as f:
+        configs = json.load(f)
+    for config in configs:
+        generate_one(config, training_time, training_cores, custom_params_path, use_local_params, verbose)
+    print(f"Generate_configs.py: generated {len(configs)} experiment configurations")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    verbose = '--verbose' in sys.argv
+    if verbose:
+        sys.argv = [a for a in sys.argv if a != '--verbose']
+    if sys.argv[1] == '--batch':
+        # --batch <configs.json> <training_time> <training_cores> <custom_params_path> <use_local_params>
+        main_batch(sys.argv[2], sys.argv[3], sys.argv[4], sys.argv[5], sys.argv[6].lower() == 'true', verbose)
+    else:
+        main(verbose)
\ No newline at end of file
@@ -1,19 +1,61 @@
 import numpy as np
-import matplotlib.pyplot as plt
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _pareto_efficient_nd(costs):
+    # Pairwise-domination scan for 3+ objectives; numba lowers the loops to
+    # native code (prange over rows) when it is installed.
+    n = costs.shape[0]
+    keep = np.ones(n, dtype=np.bool_)
+    for i in prange(n):
+        for j in range(n):
+            if i == j:
+                continue
+            dominates = True
+            strict = False
+            for k in range(costs.shape[1]):
+                if costs[j, k] > costs[i, k]:
+                    dominates = False
+                    break
+                if costs[j, k] < costs[i, k]:
+                    strict = True
+            if dominates and strict:
+                keep[i] = False
+                break
+    return keep
+
+
+if njit is not None:
+    _pareto_efficient_nd = njit(cache=True, parallel=True)(_pareto_efficient_nd)
+
 
 def is_pareto_efficient(costs):
     """
-    Find the Pareto-efficient points (minimizing both objectives)
+    Find the Pareto-efficient points (minimizing all objectives).
+    Two objectives take a sort-and-sweep in O(N log N): after sorting by
+    (x, then y), a point is efficient iff its y is strictly below every y
+    seen before it. More objectives go through the _pareto_efficient_nd
+    kernel.
     """
-    is_efficient = np.ones(costs.shape[0], dtype=bool)
-    for i, c in enumerate(costs):
-        if is_efficient[i]:
-            # Remove dominated points (those worse in both dimensions)
-            is_efficient[is_efficient] = np.any(costs[is_efficient] < c, axis=1)
-            is_efficient[i] = True
+    if costs.shape[1] != 2:
+        return _pareto_efficient_nd(np.ascontiguousarray(costs, dtype=np.float64))
+    order = np.lexsort((costs[:, 1], costs[:, 0]))
+    y_sorted = costs[order, 1]
+    # strict running minimum of all points preceding each position
+    prev_min = np.concatenate(([np.inf], np.minimum.accumulate(y_sorted)[:-1]))
+    is_efficient = np.zeros(costs.shape[0], dtype=bool)
+    is_efficient[order[y_sorted < prev_min]] = True
     return is_efficient
 
 def plot_pareto_front(X, Y):
+    # deferred: importing this module for is_pareto_efficient alone
+    # should not pay for matplotlib
+    import matplotlib.pyplot as plt
 
     # Combine X and Y into a cost matrix
     costs = np.column_stack((X, Y))
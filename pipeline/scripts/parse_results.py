@@ -3,53 +3,100 @@ import os
 import pandas as pd
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # This script aggregates training results from multiple experiment folders into a single CSV file. 
 
 # Get the list of input paths from Nextflow
 # training_results = "${training_results}".split()
     
-def main(training_results):
-    results_df = pd.DataFrame()
-    for training_result in training_results:
-        print(training_result)
-        # Each training_result is a path to a folder
-        file = os.path.join(training_result, 'outLogs', 'garbage.ods')
-        params_path = os.path.join(training_result, 'params', 'trainParams.json')
-        seed = None
-        instrType = None
-        instrSetName = None
-        if os.path.isfile(params_path):
-            with open(params_path) as pf:
-                params = json.load(pf)
-                seed = params.get('seed')
-                instrType = params.get('instrType')
-                instrSetName = params.get('instrSetName')
-                useInstrTrig = params.get('useInstrTrig')
-                useInstrLogExp = params.get('useInstrLogExp')
-                useInstrComparison = params.get('useInstrComparison')
-                useInstrExpensiveArithmetic = params.get('useInstrExpensiveArithmetic')
-                useInstrZmmul = bool(params.get('useInstrZmmul', False))
-                useInstrLog2Exp2 = bool(params.get('useInstrLog2Exp2', False))
-
-        if os.path.isfile(file):
-            with open(file) as f:
-                lines = f.readlines()
-            columns = lines[1].split()
-            df = pd.read_csv(file, sep='\\s+', skiprows=2, names=columns)
-            df['seed'] = seed
-            df['instrType'] = instrType
-            df['instrSetName'] = instrSetName
-            df['useInstrTrig'] = useInstrTrig
-            df['useInstrLogExp'] = useInstrLogExp
-            df['useInstrComparison'] = useInstrComparison
-            df['useInstrExpensiveArithmetic'] = useInstrExpensiveArithmetic
-            df['useInstrZmmul'] = useInstrZmmul
-            df['useInstrLog2Exp2'] = useInstrLog2Exp2
-            results_df = pd.concat([results_df, df]) 
+_PARAM_KEYS = frozenset((
+    'seed', 'instrType', 'instrSetName', 'useInstrTrig', 'useInstrLogExp',
+    'useInstrComparison', 'useInstrExpensiveArithmetic', 'useInstrZmmul',
+    'useInstrLog2Exp2',
+))
+
+def _read_params(params_path):
+    # Returns the wanted top-level keys of trainParams.json. With ijson the
+    # file is streamed and the scan stops once every key has been seen; the
+    # fallback materializes the whole dict via json.load.
+    if ijson is not None:
+        found = {}
+        with open(params_path, 'rb') as pf:
+            for key, value in ijson.kvitems(pf, ''):
+                if key in _PARAM_KEYS:
+                    found[key] = value
+                    if len(found) == len(_PARAM_KEYS):
+                        break
+        return found
+    with open(params_path) as pf:
+        return json.load(pf)
+
+def parse_one(training_result):
+    # Parses one experiment folder; returns its DataFrame, or None when the
+    # folder holds no results file.
+    print(training_result)
+    # Each training_result is a path to a folder
+    file = os.path.join(training_result, 'outLogs', 'garbage.ods')
+    params_path = os.path.join(training_result, 'params', 'trainParams.json')
+    seed = None
+    instrType = None
+    instrSetName = None
+    useInstrTrig = None
+    useInstrLogExp = None
+    useInstrComparison = None
+    useInstrExpensiveArithmetic = None
+    useInstrZmmul = None
+    useInstrLog2Exp2 = None
+    try:
+        params = _read_params(params_path)
+        seed = params.get('seed')
+        instrType = params.get('instrType')
+        instrSetName = params.get('instrSetName')
+        useInstrTrig = params.get('useInstrTrig')
+        useInstrLogExp = params.get('useInstrLogExp')
+        useInstrComparison = params.get('useInstrComparison')
+        useInstrExpensiveArithmetic = params.get('useInstrExpensiveArithmetic')
+        useInstrZmmul = bool(params.get('useInstrZmmul', False))
+        useInstrLog2Exp2 = bool(params.get('useInstrLog2Exp2', False))
+    except FileNotFoundError:
+        pass
+
+    try:
+        # line 0 is junk, line 1 is the header: read_csv handles both in one pass
+        df = pd.read_csv(file, sep=r'\s+', skiprows=1, header=0, engine='c')
+    except FileNotFoundError:
+        return None
+    df['seed'] = seed
+    df['instrType'] = instrType
+    df['instrSetName'] = instrSetName
+    df['useInstrTrig'] = useInstrTrig
+    df['useInstrLogExp'] = useInstrLogExp
+    df['useInstrComparison'] = useInstrComparison
+    df['useInstrExpensiveArithmetic'] = useInstrExpensiveArithmetic
+    df['useInstrZmmul'] = useInstrZmmul
+    df['useInstrLog2Exp2'] = useInstrLog2Exp2
+    return df
+
+
+def main(training_results, parquet=False):
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        frames = [df for df in ex.map(parse_one, training_results) if df is not None]
 
+    results_df = pd.concat(frames, ignore_index=True, copy=False) if frames else pd.DataFrame()
+    # results.csv is what parse_results.nf publishes; parquet is an opt-in
+    # extra for downstream pandas consumers (faster load, dtypes preserved).
     results_df.to_csv('results.csv', index=False)
+    if parquet:
+        results_df.to_parquet('results.parquet', engine='pyarrow', compression='zstd')
 
 if __name__ == "__main__":
-    training_results = sys.argv[1:]
-    main(training_results)
\ No newline at end of file
+    args = sys.argv[1:]
+    parquet = '--parquet' in args
+    training_results = [a for a in args if a != '--parquet']
+    main(training_results, parquet=parquet)
\ No newline at end of file